@@ -12,10 +12,35 @@ Exported names:
     ProjectLens: The main ProjectLens class for scanning and exporting projects.
 """
 
-from importlib.metadata import version
+# Avoid importing `typing` at runtime, type checkers treat this name specially
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from projectlens.core import ProjectLens
 
-from projectlens.core import ProjectLens
+__all__ = ["ProjectLens"]
 
-__version__ = version("projectlens")
 
-__all__ = ["ProjectLens"]
+def __getattr__(name: str) -> object:
+    """Lazily load `ProjectLens` and `__version__` on first access (PEP 562).
+
+    This keeps `import projectlens` cheap, deferring the import of the core module
+    and of `importlib.metadata` until they are actually needed. Loaded values are
+    stored as module globals, so later lookups bypass this function.
+    """
+    if name == "ProjectLens":
+        from projectlens import core
+
+        value = core.ProjectLens
+    elif name == "__version__":
+        from importlib.metadata import version
+
+        value = version("projectlens")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module attributes, including the lazily loaded ones."""
+    return sorted([*globals(), "ProjectLens", "__version__"])
@@ -10,7 +10,6 @@ Functions:
 """
 
 import logging
-from importlib import resources
 from pathlib import Path
 from typing import Optional, Union
 
@@ -64,6 +63,8 @@ def load_ignore_patterns(ignore_file: Optional[Union[str, Path]] = None) -> set[
 
         # Fallback to default `.projectignore` in projectlens/configs/
         if ignore_path is None:
+            from importlib import resources
+
             ignore_path = resources.files(projectlens.configs).joinpath(
                 ".projectignore"
             )
@@ -8,11 +8,17 @@ Classes:
     ProjectLens: Main class for scanning and exporting project file contents.
 """
 
+import functools
 import logging
 import os
+import re
+import threading
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
-from fnmatch import fnmatch
+from fnmatch import translate
 from pathlib import Path
 from typing import Optional, Union
 
@@ -21,6 +27,139 @@ from projectlens.utils import bytes_to_kb, kb_to_bytes
 
 logger.setLevel(logging.INFO)
 
+_READ_BUFFER_SIZE = 1 << 20
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Per-thread read buffers, reused across the files rendered by each worker thread
+_read_buffers = threading.local()
+
+# Directories modified this recently may still change within the same mtime tick
+_RACY_MTIME_NS = 2_000_000_000
+
+
+@functools.lru_cache(maxsize=4096)
+def _listdir(dirpath: str, mtime_ns: int) -> tuple[tuple[str, bool, bool], ...]:
+    """List a directory as `(name, is_dir, is_symlink)` tuples.
+
+    Results are cached on the directory's modification time, which changes whenever
+    an entry is added, removed or renamed, so rescanning an unchanged directory skips
+    the `readdir` calls. File sizes are deliberately not part of the listing, since
+    editing a file in place does not touch its parent directory.
+
+    Args:
+        dirpath (str): Directory to list.
+        mtime_ns (int): Modification time of `dirpath`, used as the cache key.
+
+    Returns:
+        Tuple[Tuple[str, bool, bool], ...]: The directory entries.
+    """
+    with os.scandir(dirpath) as it:
+        return tuple((entry.name, entry.is_dir(), entry.is_symlink()) for entry in it)
+
+
+def _listdir_cached(dirpath: str) -> tuple[tuple[str, bool, bool], ...]:
+    """List a directory, reusing the cached listing if it has not been modified.
+
+    Listings of directories modified within the last couple of seconds bypass the
+    cache, as a further change within the same timestamp tick would go unnoticed.
+
+    Args:
+        dirpath (str): Directory to list.
+
+    Returns:
+        Tuple[Tuple[str, bool, bool], ...]: The directory entries.
+    """
+    mtime_ns = os.stat(dirpath).st_mtime_ns
+    if time.time_ns() - mtime_ns < _RACY_MTIME_NS:
+        return _listdir.__wrapped__(dirpath, mtime_ns)
+    return _listdir(dirpath, mtime_ns)
+
+
+# Case-insensitive platforms match patterns the way `fnmatch.fnmatch` does there
+_PATTERN_FLAGS = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+
+
+def _native_path(path: str) -> str:
+    """Convert a `/`-separated relative path to the native path separator.
+
+    Args:
+        path (str): Relative path using `/` as separator.
+
+    Returns:
+        str: The same path using `os.sep` as separator.
+    """
+    return path if os.sep == "/" else path.replace("/", os.sep)
+
+
+class _GlobMatcher:
+    """Match paths against a set of glob patterns using compiled regexes.
+
+    Patterns are translated with `fnmatch.translate` and joined into one regex per
+    kind: patterns without a `/` match the last path component only, while patterns
+    with a `/` match the whole path relative to the project root. The common
+    name-only check runs first, so most paths never touch the full-path regex. Each
+    pattern is wrapped in its own named group, so the pattern that matched can
+    still be recovered for logging. Paths use `/` as separator on every platform.
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        """Compile the glob patterns.
+
+        Args:
+            patterns (Iterable[str]): Glob patterns to match against.
+        """
+        self.patterns = tuple(sorted(patterns))
+        self._name_patterns = []
+        self._path_patterns = []
+        for pattern in self.patterns:
+            if os.sep != "/":
+                pattern = pattern.replace(os.sep, "/")
+            if "/" in pattern.strip("/"):
+                self._path_patterns.append(pattern)
+            else:
+                self._name_patterns.append(pattern)
+        self._name_regex = self._compile(self._name_patterns)
+        self._path_regex = self._compile(self._path_patterns)
+
+    @staticmethod
+    def _compile(patterns: list[str]) -> Optional[re.Pattern]:
+        if not patterns:
+            return None
+        return re.compile(
+            "|".join(
+                f"(?P<p{i}>{translate(pattern.strip('/'))})"
+                for i, pattern in enumerate(patterns)
+            ),
+            _PATTERN_FLAGS,
+        )
+
+    def match(self, path: str) -> Optional[str]:
+        """Return the pattern matching `path`, or None if no pattern matches.
+
+        Args:
+            path (str): `/`-separated path relative to the project root, or a name.
+
+        Returns:
+            Optional[str]: The matching pattern, if any.
+        """
+        if self._name_regex is not None:
+            match = self._name_regex.match(path[path.rfind("/") + 1 :])
+            if match is not None:
+                return self._name_patterns[int(match.lastgroup[1:])]
+        if self._path_regex is not None:
+            match = self._path_regex.match(path)
+            if match is not None:
+                return self._path_patterns[int(match.lastgroup[1:])]
+        return None
+
+
+# Skipped file categories and the `ProjectMetadata` attributes storing them
+_SKIPPED_FILES_FIELDS = {
+    "pattern_matching": "skipped_pattern",
+    "exceeded_size": "skipped_size",
+    "failed": "skipped_failed",
+}
+
 
 @dataclass
 class ProjectMetadata:
@@ -28,13 +167,55 @@ class ProjectMetadata:
 
     scanned_files: list[str] = field(default_factory=list)
     skipped_dirs: list[str] = field(default_factory=list)
-    skipped_files: dict[str, list[str]] = field(
-        default_factory=lambda: {
-            "pattern_matching": [],
-            "exceeded_size": [],
-            "failed": [],
+    skipped_pattern: list[str] = field(default_factory=list)
+    skipped_size: list[str] = field(default_factory=list)
+    skipped_failed: list[str] = field(default_factory=list)
+
+    @property
+    def skipped_files(self) -> dict[str, list[str]]:
+        """Skipped files by category: pattern_matching, exceeded_size and failed.
+
+        Returns:
+            Dict[str, List[str]]:
+                The skipped file lists themselves, so appends reach the attributes.
+        """
+        return {
+            category: getattr(self, attribute)
+            for category, attribute in _SKIPPED_FILES_FIELDS.items()
         }
-    )
+
+    @skipped_files.setter
+    def skipped_files(self, skipped_files: Mapping[str, list[str]]) -> None:
+        """Replace all skipped file lists, categories left out become empty.
+
+        Args:
+            skipped_files (Mapping[str, List[str]]): Skipped files by category.
+
+        Raises:
+            KeyError: If a category is unknown.
+        """
+        unknown = set(skipped_files) - set(_SKIPPED_FILES_FIELDS)
+        if unknown:
+            raise KeyError(f"Unknown skipped file categories: {sorted(unknown)}")
+        for category, attribute in _SKIPPED_FILES_FIELDS.items():
+            setattr(self, attribute, list(skipped_files.get(category, [])))
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "ProjectMetadata":
+        """Create metadata from the dictionary format returned by `to_dict`.
+
+        Args:
+            data (Mapping): Dictionary with scanned and skipped files.
+
+        Returns:
+            ProjectMetadata: Metadata holding copies of the given file lists.
+        """
+        metadata = cls(
+            scanned_files=list(data.get("scanned_files", [])),
+            skipped_dirs=list(data.get("skipped_dirs", [])),
+        )
+        metadata.skipped_files = data.get("skipped_files", {})
+        return metadata
 
     def to_dict(self) -> dict:
         """Convert metadata into a dictionary format.
@@ -45,7 +226,7 @@ class ProjectMetadata:
         return {
             "scanned_files": self.scanned_files,
             "skipped_dirs": self.skipped_dirs,
-            "skipped_files": dict(self.skipped_files.items()),
+            "skipped_files": self.skipped_files,
         }
 
     def report_statistics(self) -> str:
@@ -55,19 +236,17 @@ class ProjectMetadata:
             str: Formatted summary of scanned and skipped files.
         """
         total_skipped_files = len(
-            {v for values in self.skipped_files.values() for v in values}
+            {*self.skipped_pattern, *self.skipped_size, *self.skipped_failed}
         )
-        skipped_pattern_matching = len(self.skipped_files["pattern_matching"])
-        skipped_exceed_fsize = len(self.skipped_files["exceeded_size"])
 
         return (
             "\tStatistics\n"
             f"\t├── Scanned files: {len(self.scanned_files)}\n"
             f"\t├── Skipped directories: {len(self.skipped_dirs)}\n"
             f"\t└── Skipped files (total={total_skipped_files})\n"
-            f"\t    ├── Pattern matching: {skipped_pattern_matching}\n"
-            f"\t    ├── Exceed file size: {skipped_exceed_fsize}\n"
-            f"\t    └── Failed: {len(self.skipped_files['failed'])}"
+            f"\t    ├── Pattern matching: {len(self.skipped_pattern)}\n"
+            f"\t    ├── Exceed file size: {len(self.skipped_size)}\n"
+            f"\t    └── Failed: {len(self.skipped_failed)}"
         )
 
     def report_inspection(self) -> str:
@@ -107,19 +286,15 @@ class ProjectMetadata:
 
         # Pattern matching files
         tree.append("\t    ├── Ignored files")
-        tree.append(
-            format_file_list(self.skipped_files["pattern_matching"], "\t    │   ")
-        )
+        tree.append(format_file_list(self.skipped_pattern, "\t    │   "))
 
         # Exceeded size files
         tree.append("\t    ├── Exceeded size files")
-        tree.append(format_file_list(self.skipped_files["exceeded_size"], "\t    │   "))
+        tree.append(format_file_list(self.skipped_size, "\t    │   "))
 
         # Failed files
         tree.append("\t    └── Failed files")
-        tree.append(
-            format_file_list(self.skipped_files["failed"], "\t        ", is_last=True)
-        )
+        tree.append(format_file_list(self.skipped_failed, "\t        ", is_last=True))
 
         return "\n".join(tree)
 
@@ -128,7 +303,7 @@ class ProjectLens:
     """Main class for scanning and exporting project files.
 
     Attributes:
-        extensions (Set[str]): Set of file extensions to include.
+        extensions (Tuple[str, ...]): Normalized file extensions to include.
         include (Optional[Set[str]]): Set of specific files to include.
         exclude (Optional[Set[str]]): Set of patterns to exclude.
         default_ignore (Optional[Set[str]])
@@ -157,93 +332,272 @@ class ProjectLens:
                 Path to file with default patterns to ignore (like .gitignore).
             max_file_size (Union[int, float], optional):
                 Maximum file size in KB. Defaults to 1000.
+
+        Raises:
+            ValueError: If no extensions are provided.
         """
+        if not extensions:
+            raise ValueError("No valid extensions provided")
+
         self.extensions = self._normalize_extensions(extensions)
         self.include = set(include or set())
         self.default_ignore = load_ignore_patterns(ignore_file)
         self.exclude = set(exclude or set()) | self.default_ignore
         self.max_file_size = max_file_size or 1_000
         self.metadata = ProjectMetadata()
+        # Public tuple for the API, dotted set for per-file lookups during the scan
+        self._dot_extensions = frozenset(f".{ext}" for ext in self.extensions)
+        self._include_matcher = _GlobMatcher(self.include)
+        self._exclude_matcher = _GlobMatcher(self.exclude)
 
     @staticmethod
-    def _normalize_extensions(extensions: Union[list[str], set[str]]) -> tuple[str]:
+    def _normalize_extensions(
+        extensions: Union[list[str], set[str]],
+    ) -> tuple[str, ...]:
         """Normalize file extensions by converting them to lowercase and removing dots.
 
         Args:
             extensions (List[str]): List of file extensions.
 
         Returns:
-            Tuple[str]: Normalized extensions.
+            Tuple[str, ...]: Normalized extensions.
         """
-        extensions = tuple(ext.lower().lstrip(".") for ext in extensions)
-        if not extensions:
-            raise ValueError("No valid extensions provided")
-        return extensions
+        return tuple(ext.lower().lstrip(".") for ext in extensions)
 
-    @staticmethod
-    def _normalize_path(
-        project_path: Union[str, Path], target_path: Union[str, Path]
-    ) -> str:
-        target_path = Path(target_path)
-        project_path = Path(project_path).resolve()
-        return str(target_path.relative_to(project_path))
+    def _has_extension(self, filename: str) -> bool:
+        """Check whether a filename ends with one of the configured extensions.
 
-    @staticmethod
-    def _should_ignore(
-        path: Union[str, Path], ignore_patterns: list[str], verbose: bool = True
-    ) -> bool:
-        path = Path(path)
-        for ignore_pattern in ignore_patterns:
-            if fnmatch(path.name, ignore_pattern):
-                if verbose:
-                    logger.debug(f"Skipping {path} due to pattern {ignore_pattern}")
+        Each dotted suffix of the name (e.g. `.gz`, then `.tar.gz`) is looked up in a
+        precomputed set, so the cost does not grow with the number of extensions.
+
+        Args:
+            filename (str): File name to check.
+
+        Returns:
+            bool: True if the file has one of the configured extensions.
+        """
+        filename = filename.lower()
+        dot = filename.rfind(".")
+        while dot != -1:
+            if filename[dot:] in self._dot_extensions:
                 return True
+            dot = filename.rfind(".", 0, dot)
         return False
 
+    def _walk(self, root: str) -> Iterator[tuple[str, str, str]]:
+        """Walk a directory tree, pruning excluded directories.
+
+        Directories matching an exclude pattern are recorded in the metadata and never
+        descended into. As with `os.walk`, symlinked directories are not followed.
+        Directory listings are cached across scans, see `_listdir`.
+
+        Args:
+            root (str): Absolute path of the directory to walk.
+
+        Yields:
+            Tuple[str, str, str]: Name, absolute path and `/`-separated path relative
+                to `root` of each file.
+        """
+        should_ignore = self._should_ignore
+        exclude_matcher = self._exclude_matcher
+        skipped_dirs_append = self.metadata.skipped_dirs.append
+
+        stack = [(root, "")]
+        while stack:
+            dirpath, reldir = stack.pop()
+            try:
+                entries = _listdir_cached(dirpath)
+            except OSError:
+                continue
+
+            subdirs = []
+            for name, is_dir, is_symlink in entries:
+                path = os.path.join(dirpath, name)
+                relpath = f"{reldir}/{name}" if reldir else name
+                if is_dir:
+                    if should_ignore(relpath, exclude_matcher):
+                        skipped_dirs_append(_native_path(relpath))
+                    elif not is_symlink:
+                        subdirs.append((path, relpath))
+                else:
+                    yield name, path, relpath
+            stack.extend(reversed(subdirs))
+
+    def _classify(
+        self, filename: str, file_path: str, relpath: str
+    ) -> tuple[Optional[str], int]:
+        """Decide whether a file found during the scan is exported or skipped.
+
+        Checks run from cheapest to most expensive: the exclude patterns first, so
+        every excluded file is reported as such, then the extension set lookup and the
+        include patterns, and the size limit last, since it is the only check needing
+        a `stat` call and only selected files pay for it.
+
+        Args:
+            filename (str): Name of the file.
+            file_path (str): Absolute path of the file.
+            relpath (str): `/`-separated path relative to the project.
+
+        Returns:
+            Tuple[Optional[str], int]: Either "scanned" or the `skipped_files`
+                category of the file, or None if it was not selected at all, and its
+                size in bytes when known (0 otherwise).
+        """
+        if self._should_ignore(relpath, self._exclude_matcher):
+            return "pattern_matching", 0
+
+        if not (
+            self._has_extension(filename)
+            or self._include_matcher.match(relpath) is not None
+        ):
+            return None, 0
+
+        try:
+            file_size = os.stat(file_path).st_size
+        except OSError as e:
+            logger.warning(f"Skipping unreadable file: {relpath} ({e!s})")
+            return "failed", 0
+
+        if file_size > kb_to_bytes(self.max_file_size):
+            logger.warning(
+                f"Skipping large file: {relpath} ({bytes_to_kb(file_size):,.1f} KB)"
+            )
+            return "exceeded_size", file_size
+
+        return "scanned", file_size
+
+    @staticmethod
+    def _should_ignore(path: str, matcher: _GlobMatcher, verbose: bool = True) -> bool:
+        ignore_pattern = matcher.match(path)
+        if ignore_pattern is None:
+            return False
+        if verbose:
+            logger.debug(f"Skipping {path} due to pattern {ignore_pattern}")
+        return True
+
+    @staticmethod
+    def _read_file(path: str, size: int) -> Union[bytes, memoryview]:
+        """Read the raw contents of a scanned file.
+
+        Contents are read into a per-thread buffer reused across files, and the
+        returned view into it is only valid until the next call from the same thread.
+        The buffer has room for one byte more than `size`, so a file that grew since
+        it was scanned fills it up and is read in full into a larger buffer.
+        Line endings are normalized to LF.
+
+        Args:
+            path (str): Absolute path of the file.
+            size (int): File size in bytes, used to grow the read buffer if needed.
+
+        Returns:
+            Union[bytes, memoryview]: Raw file contents.
+        """
+        buffer = getattr(_read_buffers, "buffer", None)
+        if buffer is None or size >= len(buffer):
+            buffer = bytearray(max(size + 1, _READ_BUFFER_SIZE))
+            _read_buffers.buffer = buffer
+        view = memoryview(buffer)
+        with open(path, "rb", buffering=0) as f:
+            n = 0
+            while chunk_size := f.readinto(view[n:]):
+                n += chunk_size
+                if n == len(buffer):
+                    buffer = bytearray(2 * n)
+                    buffer[:n] = view
+                    _read_buffers.buffer = buffer
+                    view = memoryview(buffer)
+        if buffer.find(b"\r", 0, n) != -1:
+            # Match the universal newlines translation of text-mode reads
+            return bytes(view[:n]).replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        return view[:n]
+
+    def _render_file(self, file: tuple[str, str, int]) -> tuple[bytes, bool]:
+        """Render the export section of a scanned file.
+
+        Files that cannot be read as UTF-8 text have their contents replaced by an
+        error message. Failures are returned rather than recorded here, so metadata
+        is only updated from the calling thread, in file order.
+
+        Args:
+            file (Tuple[str, str, int]):
+                Normalized path, absolute path and size in bytes of the file.
+
+        Returns:
+            Tuple[bytes, bool]:
+                UTF-8 encoded section, with the file header, contents and footer,
+                and whether the file failed to be read.
+        """
+        file_path, path, size = file
+        header = f"File: {file_path}\n{'-' * 80}\n".encode()
+        footer = f"\n{'=' * 80}\n\n".encode()
+        try:
+            content = self._read_file(path, size)
+            section = b"".join([header, content, footer])
+            # ASCII is valid UTF-8, so only other contents need a full decode
+            if not section.isascii():
+                str(content, "utf-8")
+        except Exception as e:
+            return b"".join([header, f"ERROR: {e!s}".encode(), footer]), True
+        return section, False
+
     def _write(
         self,
         folder_path: Path,
-        file_contents: dict[str, str],
+        files: list[tuple[str, str, int]],
         output_file: Optional[str] = None,
     ) -> None:
         """Write scanned file contents to an output file.
 
+        The output is assembled as lists of UTF-8 encoded chunks and handed to a
+        single large buffered writer. File sections are rendered by a thread pool,
+        since reading is I/O bound and releases the GIL.
+
         Args:
             folder_path (Path): Root directory of the project.
-            file_contents (Dict[str, str]): Dictionary of file paths and contents.
+            files (List[Tuple[str, str, int]]):
+                Normalized path, absolute path and size in bytes of scanned files.
             output_file (str): Path to the output file.
         """
         logger.info(f"Writing contents to: {output_file}")
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write("Project Content Export\n")
-            f.write(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Source directory: {folder_path}\n")
-            f.write(
-                "Included file extensions: "
-                f"{', '.join(f'.{ext}' for ext in sorted(self.extensions))}\n"
+        separator = "=" * 80
+        header = [
+            "Project Content Export\n",
+            f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+            f"Source directory: {folder_path}\n",
+            "Included file extensions: "
+            f"{', '.join(f'.{ext}' for ext in sorted(self.extensions))}\n",
+        ]
+        if self.include:
+            header.append(
+                f"Additional included files: {', '.join(sorted(self.include))}\n"
             )
-            if self.include:
-                f.write(
-                    f"Additional included files: {', '.join(sorted(self.include))}\n"
-                )
-            if self.exclude:
-                f.write(f"Exclude patterns: {', '.join(sorted(self.exclude))}\n")
-
-            f.write("Project structure:\n")
-            f.write(".\n")
-            f.write(self.generate_tree(folder_path, self.exclude))
-            f.write("\n" + "=" * 80 + "\n\n")
+        if self.exclude:
+            header.append(f"Exclude patterns: {', '.join(sorted(self.exclude))}\n")
+        header.append("Project structure:\n.\n")
+        header.append(
+            "\n".join(self._tree_lines(str(folder_path), "", self._exclude_matcher, ""))
+        )
+        header.append(f"\n{separator}\n\n")
+
+        files = sorted(files)
+        failed_append = self.metadata.skipped_failed.append
+        with open(output_file, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+            f.writelines([part.encode() for part in header])
+            with ThreadPoolExecutor() as executor:
+                # Files are read concurrently but written in sorted order
+                sections = executor.map(self._render_file, files)
+                for (file_path, _, _), (section, failed) in zip(files, sections):
+                    f.write(section)
+                    if failed:
+                        failed_append(file_path)
 
-            for file_path, content in sorted(file_contents.items()):
-                f.write(f"File: {file_path}\n")
-                f.write("-" * 80 + "\n")
-                f.write(content)
-                f.write("\n" + "=" * 80 + "\n\n")
+        # Scan details if debug is True
+        logger.debug("Project Inspection Details\n" + self.metadata.report_inspection())
 
         output_file_size = bytes_to_kb(Path(output_file).stat().st_size)
         logger.info("Project Metadata\n" + self.metadata.report_statistics())
         logger.success(
-            f"Successfully processed {len(file_contents)} files to {output_file} "
+            f"Successfully processed {len(files)} files to {output_file} "
             f"({output_file_size:,.1f} KB)."
         )
 
@@ -266,32 +620,47 @@ class ProjectLens:
         Returns:
             str: Tree-like string representation of the directory structure.
         """
-        path = Path(path)
-        exclude = exclude or set()
-
-        tree = []
-        # Get all entries first
-        all_entries = sorted(path.iterdir(), key=lambda x: (x.is_file(), x.name))
-
-        # Filter out entries that should be excluded before processing
-        filtered_entries = []
-        for entry in all_entries:
-            if not self._should_ignore(str(entry), exclude, verbose=False):
-                filtered_entries.append(entry)
-
-        # Now process only the filtered entries
-        for i, entry in enumerate(filtered_entries):
-            is_last = i == len(filtered_entries) - 1
-            node = "└──" if is_last else "├──"
-
-            if entry.is_file():
-                tree.append(f"{prefix}{node} {entry.name}")
-            elif entry.is_dir():
-                tree.append(f"{prefix}{node} {entry.name}")
-                next_prefix = f"{prefix}{'    ' if is_last else '│   '}"
-                tree.append(self.generate_tree(entry, exclude, next_prefix))
+        return "\n".join(
+            self._tree_lines(str(path), "", _GlobMatcher(exclude or ()), prefix)
+        )
+
+    def _tree_lines(
+        self, dirpath: str, reldir: str, matcher: _GlobMatcher, prefix: str
+    ) -> Iterator[str]:
+        """Yield the lines of the directory tree, directories first and by name.
 
-        return "\n".join(filter(None, tree))
+        Args:
+            dirpath (str): Directory to list.
+            reldir (str): `/`-separated path of `dirpath` relative to the tree root.
+            matcher (_GlobMatcher): Patterns of entries to leave out of the tree.
+            prefix (str): Prefix for the lines of this directory level.
+
+        Yields:
+            str: One line per file or directory.
+        """
+        relprefix = f"{reldir}/" if reldir else ""
+        entries = sorted(
+            (
+                entry
+                for entry in _listdir_cached(dirpath)
+                if not self._should_ignore(
+                    f"{relprefix}{entry[0]}", matcher, verbose=False
+                )
+            ),
+            key=lambda entry: (not entry[1], entry[0]),
+        )
+
+        for i, (name, is_dir, is_symlink) in enumerate(entries):
+            is_last = i == len(entries) - 1
+            yield f"{prefix}{'└──' if is_last else '├──'} {name}"
+            if is_dir and not is_symlink:
+                next_prefix = f"{prefix}{'    ' if is_last else '│   '}"
+                yield from self._tree_lines(
+                    os.path.join(dirpath, name),
+                    f"{relprefix}{name}",
+                    matcher,
+                    next_prefix,
+                )
 
     def export_project(
         self, folder_path: Union[str, Path], output: Optional[str] = None
@@ -312,6 +681,8 @@ class ProjectLens:
             output = f"{folder_path.name}_{timestamp}.txt"
 
         self.exclude.add(output)
+        output_path = str(Path(output).resolve())
+        self._exclude_matcher = _GlobMatcher(self.exclude)
 
         logger.debug(
             "Included file extensions: "
@@ -326,61 +697,27 @@ class ProjectLens:
 
         logger.info(f"Starting to scan directory: {folder_path}")
         logger.debug(f"Maximum file size: {self.max_file_size:,} KB")
-        file_contents = {}
-
-        for dirpath, dirnames, filenames in os.walk(folder_path):
-            skip_mask = [
-                self._should_ignore(
-                    self._normalize_path(folder_path, Path(dirpath) / Path(dirname)),
-                    self.exclude,
-                )
-                for dirname in dirnames
-            ]
-            keep_dirs = [
-                dirname for skip, dirname in zip(skip_mask, dirnames) if not skip
-            ]
-            skip_dirs = [dirname for skip, dirname in zip(skip_mask, dirnames) if skip]
-
-            dirnames[:] = keep_dirs
-            self.metadata.skipped_dirs.extend(
-                [
-                    self._normalize_path(folder_path, Path(dirpath) / Path(skip_dir))
-                    for skip_dir in skip_dirs
-                ]
-            )
-
-            for filename in filenames:
-                file_path = Path(dirpath) / (filename)
-                file_path_normalized = self._normalize_path(folder_path, file_path)
-
-                if self._should_ignore(file_path_normalized, self.exclude):
-                    self.metadata.skipped_files["pattern_matching"].append(
-                        file_path_normalized
-                    )
-                    continue
-
-                if filename.endswith(self.extensions) or filename in self.include:
-                    file_size = file_path.stat().st_size
-                    if file_size > kb_to_bytes(self.max_file_size):
-                        logger.warning(
-                            "Skipping large file: "
-                            f"{file_path_normalized} ({bytes_to_kb(file_size):,.1f} KB)"
-                        )
-                        self.metadata.skipped_files["exceeded_size"].append(
-                            file_path_normalized
-                        )
-                    else:
-                        self.metadata.scanned_files.append(file_path_normalized)
-                        try:
-                            content = file_path.read_text(encoding="utf-8")
-                            file_contents[file_path_normalized] = content
-                        except Exception as e:
-                            file_contents[file_path_normalized] = f"ERROR: {e!s}"
-                            self.metadata.skipped_files["failed"].append(
-                                file_path_normalized
-                            )
-
-        # Scan details if debug is True
-        logger.debug("Project Inspection Details\n" + self.metadata.report_inspection())
+        files = []
+
+        # Bind the per-file calls to locals to skip attribute lookups in the hot loop
+        classify = self._classify
+        scanned_append = self.metadata.scanned_files.append
+        files_append = files.append
+        skipped_appends = {
+            category: skipped.append
+            for category, skipped in self.metadata.skipped_files.items()
+        }
 
-        self._write(folder_path, file_contents, output)
+        for filename, file_path, relpath in self._walk(str(folder_path)):
+            category, file_size = classify(filename, file_path, relpath)
+            if category is None:
+                continue
+            file_path_normalized = _native_path(relpath)
+            if category == "scanned":
+                if file_path != output_path:
+                    scanned_append(file_path_normalized)
+                    files_append((file_path_normalized, file_path, file_size))
+            else:
+                skipped_appends[category](file_path_normalized)
+
+        self._write(folder_path, files, output)
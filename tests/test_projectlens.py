@@ -19,7 +19,10 @@ To run the tests, simply invoke pytest from the project root:
     $ pytest -vv
 """
 
+import json
 import os
+import pickle
+import shutil
 import tempfile
 from collections.abc import Generator
 from pathlib import Path
@@ -30,52 +33,59 @@ from pytest import fixture
 from projectlens.core import ProjectLens, ProjectMetadata
 
 
+@fixture(scope="session")
+def test_project_structure(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a temporary test project structure, shared by all tests."""
+    root_path = tmp_path_factory.mktemp("project")
+
+    # Root level files
+    (root_path / "README.md").write_text("# Test Project")
+    (root_path / "setup.py").write_text("from setuptools import setup")
+    (root_path / "pyproject.toml").write_text("[tool.poetry]\nname = 'test'")
+    (root_path / "Dockerfile").write_text("FROM python:3.9")
+    (root_path / "requirements.txt").write_text("pytest>=7.0.0")
+    (root_path / ".gitignore").write_text("__pycache__\n*.pyc")
+
+    # Source directory
+    src_dir = root_path / "src" / "testproject"
+    os.makedirs(src_dir)
+    (src_dir / "__init__.py").write_text("# Init file")
+    (src_dir / "main.py").write_text("def main():\n    pass")
+    (src_dir / "utils.py").write_text("def helper():\n    return True")
+
+    # Tests directory
+    tests_dir = root_path / "tests"
+    os.makedirs(tests_dir)
+    (tests_dir / "__init__.py").write_text("")
+    (tests_dir / "test_main.py").write_text("def test_main():\n    assert True")
+
+    # Docs directory
+    docs_dir = root_path / "docs"
+    os.makedirs(docs_dir)
+    (docs_dir / "index.md").write_text("# Documentation")
+    (docs_dir / "guide.md").write_text("## User Guide")
+
+    # Cache directory to be ignored
+    cache_dir = root_path / "__pycache__"
+    os.makedirs(cache_dir)
+    (cache_dir / "dummy.pyc").write_text("cache file")
+
+    # Create a data directory with mixed content
+    data_dir = root_path / "data"
+    os.makedirs(data_dir)
+    (data_dir / "config.yaml").write_text("key: value")
+    (data_dir / "sample.csv").write_text("id,value\n1,test")
+    (data_dir / "large_file.bin").write_text("x" * 1_500_000)  # > 1000KB
+
+    return root_path
+
+
 @fixture
-def test_project_structure() -> Generator[Path, None, None]:
-    """Create a temporary test project structure."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        root_path = Path(temp_dir)
-
-        # Root level files
-        (root_path / "README.md").write_text("# Test Project")
-        (root_path / "setup.py").write_text("from setuptools import setup")
-        (root_path / "pyproject.toml").write_text("[tool.poetry]\nname = 'test'")
-        (root_path / "Dockerfile").write_text("FROM python:3.9")
-        (root_path / "requirements.txt").write_text("pytest>=7.0.0")
-        (root_path / ".gitignore").write_text("__pycache__\n*.pyc")
-
-        # Source directory
-        src_dir = root_path / "src" / "testproject"
-        os.makedirs(src_dir)
-        (src_dir / "__init__.py").write_text("# Init file")
-        (src_dir / "main.py").write_text("def main():\n    pass")
-        (src_dir / "utils.py").write_text("def helper():\n    return True")
-
-        # Tests directory
-        tests_dir = root_path / "tests"
-        os.makedirs(tests_dir)
-        (tests_dir / "__init__.py").write_text("")
-        (tests_dir / "test_main.py").write_text("def test_main():\n    assert True")
-
-        # Docs directory
-        docs_dir = root_path / "docs"
-        os.makedirs(docs_dir)
-        (docs_dir / "index.md").write_text("# Documentation")
-        (docs_dir / "guide.md").write_text("## User Guide")
-
-        # Cache directory to be ignored
-        cache_dir = root_path / "__pycache__"
-        os.makedirs(cache_dir)
-        (cache_dir / "dummy.pyc").write_text("cache file")
-
-        # Create a data directory with mixed content
-        data_dir = root_path / "data"
-        os.makedirs(data_dir)
-        (data_dir / "config.yaml").write_text("key: value")
-        (data_dir / "sample.csv").write_text("id,value\n1,test")
-        (data_dir / "large_file.bin").write_text("x" * 1_500_000)  # > 1000KB
-
-        yield root_path
+def mutable_project_structure(test_project_structure: Path, tmp_path: Path) -> Path:
+    """Create a private copy of the test project structure for tests modifying it."""
+    root_path = tmp_path / "project"
+    shutil.copytree(test_project_structure, root_path)
+    return root_path
 
 
 @fixture
@@ -142,6 +152,16 @@ def test_include_specific_files(test_project_structure: Path, output_file: str)
     assert "README.md" not in lens.metadata.scanned_files
 
 
+def test_include_glob_patterns(test_project_structure: Path, output_file: str) -> None:
+    """Test including files by glob pattern regardless of extension."""
+    lens = ProjectLens(extensions=["py"], include=["Docker*", "*.csv"])
+    lens.export_project(test_project_structure, output_file)
+
+    assert "Dockerfile" in lens.metadata.scanned_files
+    assert f"data{os.sep}sample.csv" in lens.metadata.scanned_files
+    assert "requirements.txt" not in lens.metadata.scanned_files
+
+
 def test_exclude_patterns(test_project_structure: Path, output_file: str) -> None:
     """Test excluding files and directories by pattern."""
     lens = ProjectLens(extensions=["py", "md"], exclude=["tests", "*.txt"])
@@ -159,6 +179,28 @@ def test_exclude_patterns(test_project_structure: Path, output_file: str) -> Non
     assert "setup.py" in lens.metadata.scanned_files
 
 
+def test_path_patterns(test_project_structure: Path, output_file: str) -> None:
+    """Test patterns containing a slash, matched against paths from the root."""
+    lens = ProjectLens(
+        extensions=["py"],
+        include=["data/*.csv"],
+        exclude=["src/testproject/utils.py", "tests/"],
+    )
+    lens.export_project(test_project_structure, output_file)
+
+    assert f"data{os.sep}sample.csv" in lens.metadata.scanned_files
+    assert f"src{os.sep}testproject{os.sep}main.py" in lens.metadata.scanned_files
+    assert (
+        f"src{os.sep}testproject{os.sep}utils.py"
+        in lens.metadata.skipped_files["pattern_matching"]
+    )
+    assert "tests" in lens.metadata.skipped_dirs
+
+    tree = lens.generate_tree(test_project_structure, exclude={"src/testproject"})
+    assert "src" in tree
+    assert "utils.py" not in tree
+
+
 def test_include_vs_exclude_priority(
     test_project_structure: Path, output_file: str
 ) -> None:
@@ -194,13 +236,35 @@ def test_max_file_size(test_project_structure: Path, output_file: str) -> None:
     assert "setup.py" in lens.metadata.scanned_files
 
 
-def test_normalize_extensions() -> None:
-    """Test that extensions are normalized properly."""
-    # Mix of formats with and without dots
-    lens = ProjectLens(extensions=["py", ".md", "TOML", ".YAML"])
+@pytest.mark.parametrize(
+    ("extensions", "expected"),
+    [
+        # Mix of formats with and without dots
+        (["py", ".md", "TOML", ".YAML"], ("py", "md", "toml", "yaml")),
+        # Extensions with dots, as passed from the CLI
+        ([".py", ".md", ".toml"], ("py", "md", "toml")),
+    ],
+)
+def test_extensions_normalization(
+    extensions: list[str], expected: tuple[str, ...]
+) -> None:
+    """Test that extensions are normalized to lowercase without dots."""
+    lens = ProjectLens(extensions=extensions)
+    assert lens.extensions == expected
+
+
+def test_extension_matching(tmp_path: Path, output_file: str) -> None:
+    """Test that extensions match whole dotted suffixes, case-insensitively."""
+    (tmp_path / "MAIN.PY").write_text("print('hello')")
+    (tmp_path / "numpy").write_text("not python")
+    (tmp_path / "archive.tar.gz").write_text("not really gzip")
+
+    lens = ProjectLens(extensions=["py", "tar.gz"])
+    lens.export_project(tmp_path, output_file)
 
-    # All should be normalized to lowercase without dots
-    assert lens.extensions == ("py", "md", "toml", "yaml")
+    assert "MAIN.PY" in lens.metadata.scanned_files
+    assert "archive.tar.gz" in lens.metadata.scanned_files
+    assert "numpy" not in lens.metadata.scanned_files
 
 
 def test_default_directory_exclusions(
@@ -241,25 +305,121 @@ def test_tree_generation(test_project_structure: Path) -> None:
     assert "├──" in tree
 
 
-def test_custom_output_file(test_project_structure: Path) -> None:
+def test_custom_output_file(mutable_project_structure: Path) -> None:
     """Test specifying custom output file."""
     lens = ProjectLens(extensions=["py"])
-    custom_output = test_project_structure / "custom_output.txt"
+    custom_output = mutable_project_structure / "custom_output.txt"
 
-    lens.export_project(test_project_structure, str(custom_output))
+    lens.export_project(mutable_project_structure, str(custom_output))
 
     # Verify file was created at specified location
     assert custom_output.exists()
     assert custom_output.stat().st_size > 0
 
 
+def test_output_file_not_exported(tmp_path: Path) -> None:
+    """Test that an output file inside the project is not exported into itself."""
+    (tmp_path / "notes.txt").write_text("line 1\r\nline 2\n")
+    output = tmp_path / "export.txt"
+
+    for _ in range(2):
+        lens = ProjectLens(extensions=["txt"])
+        lens.export_project(tmp_path, str(output))
+
+    assert lens.metadata.scanned_files == ["notes.txt"]
+    content = output.read_bytes()
+    assert b"File: export.txt" not in content
+    assert b"line 1\nline 2\n" in content
+
+
+def test_non_utf8_files_failed(tmp_path: Path, output_file: str) -> None:
+    """Test that files which are not valid UTF-8 are reported as failed."""
+    (tmp_path / "ascii.py").write_text("value = 1")
+    (tmp_path / "unicode.py").write_text("name = 'café'", encoding="utf-8")
+    (tmp_path / "binary.py").write_bytes(b"\xff\xfe\x00binary")
+
+    lens = ProjectLens(extensions=["py"])
+    lens.export_project(tmp_path, output_file)
+
+    assert lens.metadata.skipped_files["failed"] == ["binary.py"]
+    with open(output_file, encoding="utf-8") as f:
+        content = f.read()
+    assert "value = 1" in content
+    assert "name = 'café'" in content
+    assert "ERROR: 'utf-8' codec can't decode byte 0xff" in content
+
+
+def test_failed_files_order(tmp_path: Path, output_file: str) -> None:
+    """Test that failed files are reported in sorted order."""
+    for i in range(40):
+        (tmp_path / f"binary_{i:02d}.py").write_bytes(b"\xff\xfe\x00binary")
+
+    lens = ProjectLens(extensions=["py"])
+    lens.export_project(tmp_path, output_file)
+
+    expected = [f"binary_{i:02d}.py" for i in range(40)]
+    assert lens.metadata.skipped_files["failed"] == expected
+
+
+def test_pickle_after_export(test_project_structure: Path, output_file: str) -> None:
+    """Test that ProjectLens instances can be pickled after an export."""
+    lens = ProjectLens(extensions=["py"])
+    lens.export_project(test_project_structure, output_file)
+
+    restored = pickle.loads(pickle.dumps(lens))
+
+    assert restored.extensions == lens.extensions
+    assert restored.metadata == lens.metadata
+
+
+def test_read_file_grown_since_scan(tmp_path: Path) -> None:
+    """Test that files larger than their scanned size are read in full."""
+    path = tmp_path / "grown.py"
+    content = b"x = 1\n" * 500_000
+    path.write_bytes(content)
+
+    lens = ProjectLens(extensions=["py"])
+
+    assert bytes(lens._read_file(str(path), 10)) == content
+
+
+def test_output_file_order(tmp_path: Path, output_file: str) -> None:
+    """Test that file sections are written in sorted order."""
+    for i in range(50):
+        (tmp_path / f"module_{i:02d}.py").write_text(f"value = {i}")
+
+    lens = ProjectLens(extensions=["py"])
+    lens.export_project(tmp_path, output_file)
+
+    with open(output_file) as f:
+        sections = [line for line in f if line.startswith("File: ")]
+    assert sections == [f"File: module_{i:02d}.py\n" for i in range(50)]
+
+
+def test_rescan_detects_changes(tmp_path: Path, output_file: str) -> None:
+    """Test that cached directory listings are refreshed when a directory changes."""
+    (tmp_path / "main.py").write_text("print('hello')")
+    # Backdate the directory so its listing is eligible for caching
+    os.utime(tmp_path, ns=(0, 0))
+
+    lens = ProjectLens(extensions=["py"])
+    lens.export_project(tmp_path, output_file)
+    assert lens.metadata.scanned_files == ["main.py"]
+
+    (tmp_path / "utils.py").write_text("def helper():\n    return True")
+
+    lens = ProjectLens(extensions=["py"])
+    lens.export_project(tmp_path, output_file)
+    assert sorted(lens.metadata.scanned_files) == ["main.py", "utils.py"]
+
+
 def test_metadata_reporting() -> None:
     """Test metadata reporting functions."""
     metadata = ProjectMetadata()
     metadata.scanned_files = ["file1.py", "file2.py"]
     metadata.skipped_dirs = ["dir1", "dir2"]
-    metadata.skipped_files["pattern_matching"] = ["skip1.txt"]
-    metadata.skipped_files["exceeded_size"] = ["large.bin"]
+    metadata.skipped_pattern = ["skip1.txt"]
+    metadata.skipped_size = ["large.bin"]
 
     # Test statistics report
     stats = metadata.report_statistics()
@@ -277,10 +437,28 @@ def test_metadata_reporting() -> None:
     assert "large.bin" in inspection
 
 
-def test_dot_in_extensions_parameter() -> None:
-    """Test that extensions with dots are handled correctly in CLI."""
-    lens = ProjectLens(extensions=[".py", ".md", ".toml"])
-    assert lens.extensions == ("py", "md", "toml")
+def test_metadata_skipped_files() -> None:
+    """Test that skipped files can still be read and assigned by category."""
+    metadata = ProjectMetadata(skipped_pattern=["skip1.txt"])
+    metadata.skipped_files["failed"].append("bad.py")
+    assert metadata.skipped_failed == ["bad.py"]
+    assert json.loads(json.dumps(metadata.skipped_files)) == {
+        "pattern_matching": ["skip1.txt"],
+        "exceeded_size": [],
+        "failed": ["bad.py"],
+    }
+
+    metadata.skipped_files = {"exceeded_size": ["large.bin"]}
+    assert metadata.skipped_pattern == []
+    assert metadata.skipped_size == ["large.bin"]
+    assert metadata.skipped_failed == []
+
+    with pytest.raises(KeyError):
+        metadata.skipped_files = {"unknown": []}
+
+    restored = ProjectMetadata.from_dict(metadata.to_dict())
+    assert restored == metadata
+    assert restored.skipped_size is not metadata.skipped_size
 
 
 def test_skipped_files_logging(
@@ -354,14 +532,15 @@ def test_wildcard_exclusion(test_project_structure: Path, output_file: str) -> N
     )
 
 
+@pytest.mark.parametrize("extensions", [[".py", ".md", ".toml"], ["PY", ".MD", "toml"]])
 def test_extensions_with_dots_in_cli(
-    test_project_structure: Path, output_file: str
+    test_project_structure: Path, output_file: str, extensions: list[str]
 ) -> None:
-    """Test handling extensions specified with dots."""
-    lens = ProjectLens(extensions=[".py", ".md", ".toml"])
+    """Test handling extensions specified with dots or in uppercase."""
+    lens = ProjectLens(extensions=extensions)
     lens.export_project(test_project_structure, output_file)
 
-    # Should handle extensions with dots properly
+    # Should handle normalized extensions properly
     assert "setup.py" in lens.metadata.scanned_files
     assert "README.md" in lens.metadata.scanned_files
 